@@ -4,7 +4,7 @@ import itertools
 from collections import defaultdict
 from copy import copy
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Sequence, cast
+from typing import Any, Mapping, Sequence
 
 from eth_abi.codec import ABICodec
 from eth_abi.registry import registry as default_registry
@@ -19,7 +19,6 @@ from eth_typing import (
 )
 from eth_utils import (
     abi_to_signature,
-    filter_abi_by_name,
     filter_abi_by_type,
     function_signature_to_4byte_selector,
     get_abi_input_types,
@@ -530,19 +529,38 @@ class ContractFunctions:
 class ContractEvents:
     abis: Sequence[ABIEvent]
 
+    def __post_init__(self) -> None:
+        # index the abis by name once, so attribute lookups don't scan the list
+        self._names: defaultdict[str, list[int]] = defaultdict(list)
+        for i, abi in enumerate(self.abis):
+            self._names[abi["name"]].append(i)
+        # events are built on first access and shared by both lookups
+        self._events: list[ContractEvent | None] = [None] * len(self.abis)
+        self._signatures: dict[str, int] | None = None
+
+    def _event(self, i: int) -> ContractEvent:
+        event = self._events[i]
+        if event is None:
+            event = self._events[i] = ContractEvent(self.abis[i])
+        return event
+
     def __getattr__(self, name: str) -> ContractEvent:
-        candidates = filter_abi_by_name(name, self.abis)
-        if len(candidates) == 0:
+        candidates = self._names.get(name)
+        if not candidates:
             raise ValueError(f"No such event: {name}")
         if len(candidates) > 1:
             raise ValueError(f"Multiple events found with name: {name}")
-        return ContractEvent(cast(ABIEvent, candidates[0]))
+        return self._event(candidates[0])
 
     def sig(self, signature: str) -> ContractEvent:
-        for abi in self.abis:
-            if abi_to_signature(abi) == signature:
-                return ContractEvent(abi)
-        raise ValueError(f"No such event signature: {signature}")
+        if self._signatures is None:
+            self._signatures = {}
+            for i, abi in enumerate(self.abis):
+                self._signatures.setdefault(abi_to_signature(abi), i)
+        try:
+            return self._event(self._signatures[signature])
+        except KeyError:
+            raise ValueError(f"No such event signature: {signature}") from None
 
 
 @dataclass
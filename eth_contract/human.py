@@ -1,5 +1,8 @@
 import re
-from typing import Iterable, cast
+import sys
+from functools import lru_cache
+from graphlib import CycleError, TopologicalSorter
+from typing import AbstractSet, Any, Callable, Iterable, Iterator, cast
 
 from eth_typing import (
     ABI,
@@ -20,32 +23,34 @@ class ExtendedComponent(ABIComponentIndexed):
 
 IDENTIFIER = r"[a-zA-Z$_][a-zA-Z0-9$_]*"
 ARRAY = r"(\[\d*\])+"
-SIGNATURE_PREFIX = re.compile(r"^(function|event|error|constructor|fallback|receive)")
+SIGNATURE_PREFIX = re.compile(
+    r"\A(function|event|error|constructor|fallback|receive)", re.ASCII
+)
 
 # Signature regexes adapted from:
 # https://github.com/wevm/abitype/tree/main/packages/abitype/src/human-readable
 ERROR_SIGNATURE_REGEX = re.compile(
-    rf"""^error\s+      # 'error' keyword
+    rf"""\Aerror\s+     # 'error' keyword
 (?P<name>{IDENTIFIER})  # name
 \(
   (?P<parameters>.*?)   # inputs
 \)
-$""",
-    re.VERBOSE,
+\Z""",
+    re.VERBOSE | re.ASCII | re.DOTALL,
 )
 
 EVENT_SIGNATURE_REGEX = re.compile(
-    rf"""^event\s+      # 'event' keyword
+    rf"""\Aevent\s+     # 'event' keyword
 (?P<name>{IDENTIFIER})  # name
 \(
     (?P<parameters>.*?) # inputs
 \)
-$""",
-    re.VERBOSE,
+\Z""",
+    re.VERBOSE | re.ASCII | re.DOTALL,
 )
 
 FUNCTION_SIGNATURE_REGEX = re.compile(
-    rf"""^function\s+   # 'function' keyword
+    rf"""\Afunction\s+  # 'function' keyword
 (?P<name>{IDENTIFIER})  # name
 \(
   (?P<parameters>.*?)   # inputs
@@ -55,61 +60,64 @@ FUNCTION_SIGNATURE_REGEX = re.compile(
 (\s+ returns \s* \(
     (?P<returns>.*?)    # outputs
 \) )?
-$""",
-    re.VERBOSE,
+\Z""",
+    re.VERBOSE | re.ASCII | re.DOTALL,
+)
+
+# `FUNCTION_SIGNATURE_REGEX` split around the parameter list, which is delimited
+# by counting parentheses, so malformed input can't backtrack through every `)`
+FUNCTION_HEAD_REGEX = re.compile(
+    rf"""\Afunction\s+  # 'function' keyword
+(?P<name>{IDENTIFIER})  # name
+\(""",
+    re.VERBOSE | re.ASCII,
+)
+
+FUNCTION_TAIL_REGEX = re.compile(
+    r"""(\s* (?P<scope>external|public) )?
+(\s+ (?P<stateMutability>pure|view|nonpayable|payable) )?
+(\s+ returns \s* \(
+    (?P<returns>.*)     # outputs
+\) )?
+\Z""",
+    re.VERBOSE | re.ASCII | re.DOTALL,
 )
 
 CONSTRUCTOR_SIGNATURE_REGEX = re.compile(
-    r"""^constructor    # 'constructor' keyword
+    r"""\Aconstructor   # 'constructor' keyword
 \(
     (?P<parameters>.*?) # inputs
 \)
 (\s*
     (?P<stateMutability>payable)
 )?
-$""",
-    re.VERBOSE,
+\Z""",
+    re.VERBOSE | re.ASCII | re.DOTALL,
 )
 
 FALLBACK_SIGNATURE_REGEX = re.compile(
-    r"""^fallback \(\) \s+ external
+    r"""\Afallback \(\) \s+ external
 (\s+
     (?P<stateMutability>payable)
 )?
-$""",
-    re.VERBOSE,
+\Z""",
+    re.VERBOSE | re.ASCII,
 )
 
-RECEIVE_SIGNATURE_REGEX = re.compile(r"^receive\(\)\s+external\s+payable$")
+RECEIVE_SIGNATURE_REGEX = re.compile(r"\Areceive\(\)\s+external\s+payable\Z", re.ASCII)
 
-# Parameter regexes
-ABI_PARAMETER_WITHOUT_TUPLE_REGEX = re.compile(
-    rf"""^
-(?P<type>{IDENTIFIER} (\s+payable)?)
-(?P<array>{ARRAY})?
-(\s+ (?P<modifier>calldata|indexed|memory|storage) )?
-(\s+ (?P<name>{IDENTIFIER}) )?
-$""",
-    re.VERBOSE,
-)
-ABI_PARAMETER_WITH_TUPLE_REGEX = re.compile(
-    rf"""^
-\( (?P<type>.+?) \)
-(?P<array>{ARRAY})?
-(\s+ (?P<modifier>calldata|indexed|memory|storage) )?
-(\s+ (?P<name>{IDENTIFIER}) )?
-$""",
-    re.VERBOSE,
-)
+# Delimiters that matter when splitting a parameter list
+PARAMETER_DELIMITER_REGEX = re.compile(r"[(),]", re.ASCII)
 
-DYNAMIC_INTEGER_REGEX = re.compile(r"^u?int$")
+# Integer aliases that default to 256 bits
+DYNAMIC_INTEGER_TYPES = frozenset({"int", "uint"})
 
 TYPE_WITHOUT_TUPLE_REGEX = re.compile(
-    rf"""^
+    rf"""\A
 (?P<type>{IDENTIFIER})
 (?P<array>{ARRAY})?
-$""",
-    re.VERBOSE,
+\Z""",
+    re.VERBOSE | re.ASCII,
 )
 
 INTEGER_SIZES = [
@@ -146,53 +154,88 @@ INTEGER_SIZES = [
     248,
     256,
 ]
-INTEGER_REGEX = re.compile(rf"^u?int({'|'.join(map(str, INTEGER_SIZES))})$")
-BYTES_REGEX = re.compile(r"^bytes([1-9]|[12][0-9]|3[0-2])$")
+
+# All valid Solidity primitive type names, precomputed for O(1) lookup
+SOLIDITY_TYPES = frozenset(
+    [
+        "address",
+        "bool",
+        "string",
+        "bytes",
+        "function",
+        # Integers (int8 to int256, uint8 to uint256, in steps of 8)
+        *(f"int{size}" for size in INTEGER_SIZES),
+        *(f"uint{size}" for size in INTEGER_SIZES),
+        # Fixed-size bytes (bytes1 to bytes32)
+        *(f"bytes{size}" for size in range(1, 33)),
+    ]
+)
 
 # Modifier sets
-EVENT_MODIFIERS = {"indexed"}
-FUNCTION_MODIFIERS = {"calldata", "memory", "storage"}
-ALL_MODIFIERS = {"indexed", "calldata", "memory", "storage"}
+EVENT_MODIFIERS = frozenset({"indexed"})
+FUNCTION_MODIFIERS = frozenset({"calldata", "memory", "storage"})
+ALL_MODIFIERS = EVENT_MODIFIERS | FUNCTION_MODIFIERS
 
-# Parameter cache
-parameter_cache: dict[str, ExtendedComponent] = {}
+# Max number of parsed parameters kept in the cache
+PARAMETER_CACHE_SIZE = 4096
+
+# Max number of parsed signature lists kept in the `parse_abi` cache
+ABI_CACHE_SIZE = 256
+
+# Max nesting depth of tuple parameters
+MAX_TUPLE_DEPTH = 80
 
 # struct signature regex
 STRUCT_SIGNATURE_REGEX = re.compile(
-    rf"""^struct\s+
+    rf"""\Astruct\s+
 (?P<name>{IDENTIFIER})\s*
 \{{\s*
-  (?P<properties>.*)
+  (?P<properties>[^{{}}]*)
 \s*\}}
-$""",
-    re.VERBOSE,
+\Z""",
+    re.VERBOSE | re.ASCII | re.DOTALL,
 )
 
 
 def is_struct_signature(signature: str) -> bool:
     """Check if signature is a struct definition."""
-    return STRUCT_SIGNATURE_REGEX.match(signature) is not None
+    # cheap prefix check first, most signatures aren't structs
+    return (
+        signature.startswith("struct")
+        and STRUCT_SIGNATURE_REGEX.match(signature) is not None
+    )
 
 
 def parse_structs(signatures: Iterable[str]) -> dict[str, list[ExtendedComponent]]:
     """
     Parse struct definitions from a list of signatures.
     Returns a StructLookup mapping struct names to their components.
+
+    The result is cached and shared between calls with the same signatures,
+    treat it as read-only.
     """
+    return _parse_structs(tuple(signatures))
+
+
+@lru_cache(maxsize=128)
+def _parse_structs(signatures: tuple[str, ...]) -> dict[str, list[ExtendedComponent]]:
     # First pass: create shallow structs (without resolving nested struct references)
     shallow_structs: dict[str, list[ExtendedComponent]] = {}
 
     for signature in signatures:
-        match = STRUCT_SIGNATURE_REGEX.match(signature)
+        # cheap prefix check first, callers may pass other signatures too
+        match = (
+            STRUCT_SIGNATURE_REGEX.match(signature)
+            if signature.startswith("struct")
+            else None
+        )
         if not match:
             continue
 
-        groups = match.groupdict()
-        name = groups["name"]
-        properties = groups["properties"].split(";")
+        name, properties = match.group("name", "properties")
 
         components = []
-        for prop in properties:
+        for prop in properties.split(";"):
             trimmed = prop.strip()
             if not trimmed:
                 continue
@@ -207,85 +250,81 @@ def parse_structs(signatures: Iterable[str]) -> dict[str, list[ExtendedComponent
         shallow_structs[name] = components
 
     # Second pass: resolve nested struct references
-    resolved_structs: dict[str, list[ExtendedComponent]] = {}
-    for name, parameters in shallow_structs.items():
-        resolved_structs[name] = _resolve_struct_components(
-            parameters, shallow_structs, set()
-        )
+    return _resolve_structs(shallow_structs)
 
-    return resolved_structs
 
-
-def _resolve_struct_components(
-    parameters: list[ExtendedComponent],
+def _resolve_structs(
     structs: dict[str, list[ExtendedComponent]],
-    ancestors: set[str],
-) -> list[ExtendedComponent]:
+) -> dict[str, list[ExtendedComponent]]:
     """
-    Recursively resolve struct references in parameter components.
-    Detects circular references.
-    """
-    components = []
-    for param in parameters:
-        param_type = param["type"]
-
-        # If already a tuple, keep it as-is
-        if param_type.startswith("tuple"):
-            components.append(param)
-            continue
-
-        # Try to match type and array suffix
-        match = TYPE_WITHOUT_TUPLE_REGEX.match(param_type)
-        if not match:
-            raise ValueError(f"Invalid ABI type parameter: {param}")
+    Resolve struct references in parameter components.
 
-        groups = match.groupdict()
-        base_type = groups["type"]
-        array_suffix = groups.get("array") or ""
-
-        # Check if this is a struct reference
-        if base_type in structs:
-            # Detect circular references
-            if base_type in ancestors:
-                raise ValueError(f"Circular reference detected: {base_type}")
-
-            # Recursively resolve nested structs
-            resolved_components = _resolve_struct_components(
-                structs[base_type], structs, ancestors | {base_type}
-            )
+    Structs are resolved in topological order of their references, so every struct
+    is resolved exactly once and nested references reuse the resolved components.
+    Circular references surface as a cycle in the dependency graph.
+    """
+    # split each field into (param, struct reference or None, array suffix)
+    fields: dict[str, list[tuple[ExtendedComponent, str | None, str]]] = {}
+    dependencies: dict[str, set[str]] = {}
+    for name, parameters in structs.items():
+        struct_fields: list[tuple[ExtendedComponent, str | None, str]] = []
+        deps: set[str] = set()
+        fields[name] = struct_fields
+        dependencies[name] = deps
+        for param in parameters:
+            param_type = param["type"]
+
+            # If already a tuple, keep it as-is
+            if param_type.startswith("tuple"):
+                struct_fields.append((param, None, ""))
+                continue
 
-            components.append(
-                {
+            # Try to match type and array suffix
+            match = TYPE_WITHOUT_TUPLE_REGEX.match(param_type)
+            if not match:
+                raise ValueError(f"Invalid ABI type parameter: {param}")
+
+            base_type, array_suffix = match.group("type", "array")
+            array_suffix = array_suffix or ""
+
+            # Check if this is a struct reference
+            if base_type in structs:
+                deps.add(base_type)
+                struct_fields.append((param, base_type, array_suffix))
+            else:
+                # Not a struct, validate it's a valid Solidity type
+                if not is_solidity_type(base_type):
+                    raise ValueError(f"Unknown type: {base_type}")
+                struct_fields.append((param, None, ""))
+
+    try:
+        order = list(TopologicalSorter(dependencies).static_order())
+    except CycleError as e:
+        raise ValueError(f"Circular reference detected: {e.args[1][0]}") from None
+
+    resolved: dict[str, list[ExtendedComponent]] = {}
+    for name in order:
+        resolved[name] = [
+            (
+                param
+                if ref is None
+                else {
                     **param,
-                    "type": f"tuple{array_suffix}",
-                    "internalType": f"struct {base_type}{array_suffix}",
-                    "components": resolved_components,
+                    "type": sys.intern(f"tuple{array_suffix}"),
+                    "internalType": sys.intern(f"struct {ref}{array_suffix}"),
+                    "components": resolved[ref],
                 }
             )
-        else:
-            # Not a struct, validate it's a valid Solidity type
-            if not is_solidity_type(base_type):
-                raise ValueError(f"Unknown type: {base_type}")
-            components.append(param)
+            for param, ref, array_suffix in fields[name]
+        ]
 
-    return components
+    # keep the definition order
+    return {name: resolved[name] for name in structs}
 
 
 def is_solidity_type(type_name: str) -> bool:
     """Check if a type is a valid Solidity primitive type."""
-    # Basic types
-    if type_name in ["address", "bool", "string", "bytes", "function"]:
-        return True
-
-    # Fixed-size bytes (bytes1 to bytes32)
-    if BYTES_REGEX.match(type_name):
-        return True
-
-    # Integers (int8 to int256, uint8 to uint256, in steps of 8)
-    if INTEGER_REGEX.match(type_name):
-        return True
-
-    return False
+    return type_name in SOLIDITY_TYPES
 
 
 def split_parameters(params: str) -> list[str]:
@@ -294,9 +333,43 @@ def split_parameters(params: str) -> list[str]:
     if not params:
         return []
 
-    # tracking indices for current parameter
+    # fast path: flat parameter list, let `str.split` do the scanning
+    if "(" not in params and ")" not in params:
+        return [p for p in map(str.strip, params.split(",")) if p]
+
+    # split at every comma and rejoin the pieces inside parentheses, counting
+    # the parentheses of each piece with `str.count`
+    result = []
+    pending: list[str] = []
+    depth = 0
+    for piece in params.split(","):
+        opening, closing = piece.count("("), piece.count(")")
+        if closing > depth and piece.rfind("(") > piece.find(")"):
+            # the depth could dip below zero inside the piece
+            return _scan_parameters(params)
+        depth += opening - closing
+        if depth < 0:
+            return _scan_parameters(params)
+        if depth:
+            pending.append(piece)
+            continue
+        if pending:
+            pending.append(piece)
+            piece = ",".join(pending)
+            pending.clear()
+        piece = piece.strip()
+        if piece:
+            result.append(piece)
+
+    if depth:
+        return _scan_parameters(params)
+    return result
+
+
+def _scan_parameters(params: str) -> list[str]:
+    """Split parameters by visiting each delimiter, reports the invalid ones."""
+    # tracking begin index for current parameter
     current_begin = 0
-    current_end = 0
 
     # tracking parenthesis depth
     depth = 0
@@ -304,146 +377,335 @@ def split_parameters(params: str) -> list[str]:
     # split result
     result = []
 
-    for i, char in enumerate(params):
-        if char == "," and depth == 0:
+    # only visit the delimiters, identifiers in between are skipped by the
+    # regex engine
+    for m in PARAMETER_DELIMITER_REGEX.finditer(params):
+        char = m.group()
+        if char == "(":
+            # Enter parentheses
+            depth += 1
+        elif char == ")":
+            # Exit parentheses
+            depth -= 1
+            if depth < 0:
+                raise ValueError(
+                    f"Invalid parenthesis: extra closing at position {m.start()}"
+                )
+        elif depth == 0:
             # Split at comma when not inside parentheses
-            param_str = params[current_begin:current_end].strip()
+            param_str = params[current_begin : m.start()].strip()
             if param_str:
                 result.append(param_str)
-            current_begin = current_end = i + 1
-        else:
-            current_end += 1
-
-            if char == "(":
-                # Enter parentheses
-                depth += 1
-            elif char == ")":
-                # Exit parentheses
-                depth -= 1
-                if depth < 0:
-                    raise ValueError(
-                        f"Invalid parenthesis: extra closing at position {i}"
-                    )
-
-    # Handle the last parameter
-    param_str = params[current_begin:current_end].strip()
-    if param_str:
-        result.append(param_str)
+            current_begin = m.end()
 
     # Validate parentheses balance
     if depth != 0:
         raise ValueError(f"Invalid parenthesis: unbalanced parentheses, depth={depth}")
 
+    # Handle the last parameter
+    param_str = params[current_begin:].strip()
+    if param_str:
+        result.append(param_str)
+
     return result
 
 
-def is_tuple(s):
-    return s and s[0] == "(" and ")" in s
+def is_identifier(s: str) -> bool:
+    """Check if a string is a valid Solidity identifier (`$` is allowed)."""
+    return s.isascii() and s.replace("$", "_").isidentifier()
+
+
+@lru_cache(maxsize=1024)
+def is_array_suffix(s: str) -> bool:
+    """
+    Check if a string is a chain of array suffixes like `[]` or `[3][]`.
+
+    Cached, the same few suffixes repeat across parameters with different names.
+    """
+    if not s.isascii() or s[:1] != "[" or s[-1:] != "]":
+        return False
+    return all(not size or size.isdecimal() for size in s[1:-1].split("]["))
+
+
+# Parts of a split parameter: type, is tuple, array suffix, modifier and name
+ParameterParts = tuple[str, bool, str, str | None, str | None]
+
+
+def split_abi_parameter(param: str) -> ParameterParts:
+    """
+    Split a parameter string into its parts without regex backtracking.
+
+    Returns `(type, is_tuple, array, modifier, name)`, for tuples `type` is the
+    raw body between the outermost parentheses.
+    """
+    if is_identifier(param):
+        # fast path: a bare type like `uint256`
+        return param, False, "", None, None
+
+    if not param or param[0].isspace() or param[-1].isspace():
+        raise ValueError(f"Invalid parameter: {param}")
+
+    if param[0] == "(":
+        # the type suffix can't contain parentheses, so the tuple body ends at
+        # the last closing one
+        close = param.rfind(")")
+        if close < 2:
+            raise ValueError(f"Invalid parameter: {param}")
+        type_ = param[1:close]
+        tail = param[close + 1 :]
+        words = tail.split()
+        # the array suffix must directly follow the closing parenthesis
+        array = words.pop(0) if tail and not tail[0].isspace() else ""
+    else:
+        words = param.split()
+        head = words.pop(0)
+        bracket = head.find("[")
+        if bracket < 0:
+            type_, array = head, ""
+            if words and words[0].partition("[")[0] == "payable":
+                # `address payable`, possibly followed by an array suffix
+                type_ = f"{type_} payable"
+                array = words.pop(0)[len("payable") :]
+        else:
+            type_, array = head[:bracket], head[bracket:]
+        if not is_identifier(type_.partition(" ")[0]):
+            raise ValueError(f"Invalid parameter: {param}")
+
+    if array and not is_array_suffix(array):
+        raise ValueError(f"Invalid parameter: {param}")
+
+    modifier = name = None
+    if len(words) == 2:
+        modifier, name = words
+        if modifier not in ALL_MODIFIERS:
+            raise ValueError(f"Invalid parameter: {param}")
+    elif len(words) == 1:
+        if words[0] in ALL_MODIFIERS:
+            modifier = words[0]
+        else:
+            name = words[0]
+    elif words:
+        raise ValueError(f"Invalid parameter: {param}")
+
+    if name is not None and not is_identifier(name):
+        raise ValueError(f"Invalid parameter: {param}")
+
+    return type_, param[0] == "(", array, modifier, name
+
+
+# Struct lookup used when parsing without struct context, never mutated
+_NO_STRUCTS: dict[str, list[ExtendedComponent]] = {}
+
+
+class _StructsRef:
+    """
+    Hashable handle of a struct lookup, compared by identity.
+
+    The parameter cache holds a strong reference to the lookup, so its id can't be
+    reused by another object while the cache entry is alive.
+    """
+
+    __slots__ = ("structs",)
+
+    def __init__(self, structs: dict[str, list[ExtendedComponent]]) -> None:
+        self.structs = structs
+
+    def __hash__(self) -> int:
+        return id(self.structs)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _StructsRef) and other.structs is self.structs
 
 
 def parse_abi_parameter(
     param: str,
-    modifiers: set[str] | None = None,
+    modifiers: AbstractSet[str] | None = None,
     structs: dict[str, list[ExtendedComponent]] | None = None,
     abi_type: str | None = None,
     event: bool = False,
 ) -> ExtendedComponent:
-    """Parse a single ABI parameter string into a structured object."""
-    if structs is None:
-        structs = {}
-
-    # Check cache
-    cache_key = f"{param}:{abi_type}:{id(structs)}"
-    if cache_key in parameter_cache:
-        return parameter_cache[cache_key]
+    """
+    Parse a single ABI parameter string into a structured object.
 
-    tuple_param = is_tuple(param)
-    regex = (
-        ABI_PARAMETER_WITH_TUPLE_REGEX
-        if tuple_param
-        else ABI_PARAMETER_WITHOUT_TUPLE_REGEX
+    Results are cached, the returned object is shared between calls and must not
+    be mutated.
+    """
+    comp, modifier = _parse_abi_parameter(
+        param, _StructsRef(structs) if structs else None, event
     )
-    match = regex.match(param)
+    _check_modifier(modifier, modifiers, abi_type)
+    return comp
+
+
+def parse_abi_parameters(
+    params: str,
+    modifiers: AbstractSet[str] | None = None,
+    structs: dict[str, list[ExtendedComponent]] | None = None,
+    abi_type: str | None = None,
+    event: bool = False,
+) -> list[ExtendedComponent]:
+    """
+    Parse a comma-separated parameter list, see `parse_abi_parameter`.
+
+    The list is split once and the struct context is shared by all parameters.
+    """
+    structs_ref = _StructsRef(structs) if structs else None
+    result = []
+    for param in split_parameters(params):
+        comp, modifier = _parse_abi_parameter(param, structs_ref, event)
+        _check_modifier(modifier, modifiers, abi_type)
+        result.append(comp)
+    return result
+
+
+def _check_modifier(
+    modifier: str | None, modifiers: AbstractSet[str] | None, abi_type: str | None
+) -> None:
+    """Validate the modifier against the ones allowed for the ABI type."""
+    if modifier and modifiers and modifier not in modifiers:
+        raise ValueError(f"Invalid modifier '{modifier}' for type {abi_type}")
+
+
+@lru_cache(maxsize=PARAMETER_CACHE_SIZE)
+def _parse_abi_parameter(
+    param: str, structs_ref: _StructsRef | None, event: bool
+) -> tuple[ExtendedComponent, str | None]:
+    """
+    Cached parameter parsing, returns the component and the raw modifier so the
+    caller can validate it against the modifiers allowed for the ABI type.
+    """
+    structs = structs_ref.structs if structs_ref is not None else _NO_STRUCTS
+    parts = split_abi_parameter(param)
+    if not parts[1]:
+        return _build_component(parts, None, structs, event)
+
+    # Nested tuples are parsed with an explicit stack instead of recursion, each
+    # entry holds the split tuple, its pending parameters and parsed components
+    stack: list[tuple[ParameterParts, Iterator[str], list[ExtendedComponent]]] = [
+        (parts, iter(split_parameters(parts[0])), [])
+    ]
+    while True:
+        parts, pending, components = stack[-1]
+        child = next(pending, None)
+        if child is None:
+            # all parameters of the innermost tuple are parsed
+            stack.pop()
+            comp, modifier = _build_component(parts, components, structs, event)
+            if not stack:
+                return comp, modifier
+            stack[-1][2].append(comp)
+            continue
+
+        if child[:1] == "(":
+            if len(stack) == MAX_TUPLE_DEPTH:
+                raise ValueError(
+                    f"Invalid parameter: tuples nested deeper than "
+                    f"{MAX_TUPLE_DEPTH} levels: {param}"
+                )
+            child_parts = split_abi_parameter(child)
+            stack.append((child_parts, iter(split_parameters(child_parts[0])), []))
+        else:
+            # non-tuple members go through the cache, so common ones like
+            # `{"type": "address"}` are one shared object everywhere
+            components.append(_parse_abi_parameter(child, structs_ref, event)[0])
 
-    if not match:
-        raise ValueError(f"Invalid parameter: {param}")
 
-    groups = match.groupdict()
-    name = groups.get("name")
-    modifier = groups.get("modifier")
-    array = groups.get("array") or ""
+def _build_component(
+    parts: ParameterParts,
+    components: list[ExtendedComponent] | None,
+    structs: dict[str, list[ExtendedComponent]],
+    event: bool,
+) -> tuple[ExtendedComponent, str | None]:
+    """Build a component from a split parameter, tuples come with components."""
+    type_, tuple_param, array, modifier, name = parts
 
-    # Build result
-    result = {}
+    # Determine type
+    if tuple_param:
+        base_type = "tuple"
+    elif type_ in structs:
+        base_type = "tuple"
+        components = structs[type_]
+    elif type_ in DYNAMIC_INTEGER_TYPES:
+        base_type = f"{type_}256"
+    elif type_ == "address payable":
+        base_type = "address"
+    else:
+        base_type = type_
 
-    if name:
-        result["name"] = name
+    # Build result in one go, with the keys in their usual order
+    result: dict[str, Any] = {"name": name} if name else {}
 
     if modifier == "indexed":
         result["indexed"] = True
     elif event:
         result["indexed"] = False
 
-    # Determine type
-    if tuple_param:
-        result["type"] = "tuple"
-        params = split_parameters(groups["type"])
-        result["components"] = [
-            parse_abi_parameter(p, structs=structs, event=event) for p in params
-        ]
-    elif groups["type"] in structs:
-        result["type"] = "tuple"
-        result["components"] = structs[groups["type"]]
-    elif DYNAMIC_INTEGER_REGEX.match(groups["type"]):
-        result["type"] = f"{groups['type']}256"
-    elif groups["type"] == "address payable":
-        result["type"] = "address"
-    else:
-        result["type"] = groups["type"]
+    # Add array suffix, type strings repeat across parameters so share one object
+    result["type"] = sys.intern(base_type + array)
 
-    # Add array suffix
-    result["type"] = result["type"] + array
+    if components is not None:
+        result["components"] = components
+        # Add internalType
+        if not tuple_param:
+            result["internalType"] = sys.intern(f"struct {type_}{array}")
 
-    # Add internalType
-    if groups["type"] in structs:
-        result["internalType"] = f"struct {groups['type']}{array}"
+    return cast(ExtendedComponent, result), modifier
 
-    # Validate modifier
-    if modifier and modifiers and modifier not in modifiers:
-        raise ValueError(f"Invalid modifier '{modifier}' for type {abi_type}")
 
-    comp = cast(ExtendedComponent, result)
-    parameter_cache[cache_key] = comp
-    return comp
+class _ParameterCache:
+    """
+    Clearable view of the parameter cache, kept for code that used the former
+    `parameter_cache` dict.
+    """
+
+    def clear(self) -> None:
+        _parse_abi_parameter.cache_clear()
+
+    def __len__(self) -> int:
+        return _parse_abi_parameter.cache_info().currsize
+
+
+parameter_cache = _ParameterCache()
+
+
+def _closing_parenthesis(s: str, start: int) -> int:
+    """
+    Find the parenthesis closing the one right before `start`, -1 if there is
+    none.
+    """
+    depth = 1
+    for m in PARAMETER_DELIMITER_REGEX.finditer(s, start):
+        char = m.group()
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if not depth:
+                return m.start()
+    return -1
 
 
 def parse_function_signature(
     signature: str, structs: dict[str, list[ExtendedComponent]] | None = None
 ) -> ABIFunction:
     """Parse a function signature."""
-    match = FUNCTION_SIGNATURE_REGEX.match(signature)
-    if not match:
+    head = FUNCTION_HEAD_REGEX.match(signature)
+    close = _closing_parenthesis(signature, head.end()) if head else -1
+    match = FUNCTION_TAIL_REGEX.match(signature, close + 1) if close >= 0 else None
+    if not head or not match:
         raise ValueError(f"Invalid function signature: {signature}")
 
-    groups = match.groupdict()
-    params = split_parameters(groups["parameters"])
+    state_mutability, returns = match.group("stateMutability", "returns")
 
     return {
         "type": "function",
-        "name": groups["name"],
-        "stateMutability": groups.get("stateMutability")  # type: ignore
-        or "nonpayable",
-        "inputs": [
-            parse_abi_parameter(p, FUNCTION_MODIFIERS, structs, "function")
-            for p in params
-        ],
-        "outputs": (
-            [
-                parse_abi_parameter(p, FUNCTION_MODIFIERS, structs, "function")
-                for p in split_parameters(groups.get("returns") or "")
-            ]
-            if groups.get("returns")
-            else []
+        "name": head["name"],
+        "stateMutability": state_mutability or "nonpayable",  # type: ignore
+        "inputs": parse_abi_parameters(
+            signature[head.end() : close], FUNCTION_MODIFIERS, structs, "function"
+        ),
+        "outputs": parse_abi_parameters(
+            returns or "", FUNCTION_MODIFIERS, structs, "function"
         ),
     }
 
@@ -456,16 +718,14 @@ def parse_event_signature(
     if not match:
         raise ValueError(f"Invalid event signature: {signature}")
 
-    groups = match.groupdict()
-    params = split_parameters(groups["parameters"])
+    name, parameters = match.group("name", "parameters")
 
     return {
         "type": "event",
-        "name": groups["name"],
-        "inputs": [
-            parse_abi_parameter(p, EVENT_MODIFIERS, structs, "event", event=True)
-            for p in params
-        ],
+        "name": name,
+        "inputs": parse_abi_parameters(
+            parameters, EVENT_MODIFIERS, structs, "event", event=True
+        ),
         "anonymous": False,
     }
 
@@ -478,15 +738,12 @@ def parse_error_signature(
     if not match:
         raise ValueError(f"Invalid error signature: {signature}")
 
-    groups = match.groupdict()
-    params = split_parameters(groups["parameters"])
+    name, parameters = match.group("name", "parameters")
 
     return {
         "type": "error",
-        "name": groups["name"],
-        "inputs": [
-            parse_abi_parameter(p, structs=structs, abi_type="error") for p in params
-        ],
+        "name": name,
+        "inputs": parse_abi_parameters(parameters, structs=structs, abi_type="error"),
     }
 
 
@@ -498,17 +755,14 @@ def parse_constructor_signature(
     if not match:
         raise ValueError(f"Invalid constructor signature: {signature}")
 
-    groups = match.groupdict()
-    params = split_parameters(groups["parameters"])
+    state_mutability, parameters = match.group("stateMutability", "parameters")
 
     return {
         "type": "constructor",
-        "stateMutability": groups.get("stateMutability")  # type: ignore
-        or "nonpayable",
-        "inputs": [
-            parse_abi_parameter(p, structs=structs, abi_type="constructor")
-            for p in params
-        ],
+        "stateMutability": state_mutability or "nonpayable",  # type: ignore
+        "inputs": parse_abi_parameters(
+            parameters, structs=structs, abi_type="constructor"
+        ),
     }
 
 
@@ -518,12 +772,9 @@ def parse_fallback_signature(signature: str) -> ABIFallback:
     if not match:
         raise ValueError(f"Invalid fallback signature: {signature}")
 
-    groups = match.groupdict()
-
     return {
         "type": "fallback",
-        "stateMutability": groups.get("stateMutability")  # type: ignore
-        or "nonpayable",
+        "stateMutability": match["stateMutability"] or "nonpayable",  # type: ignore
     }
 
 
@@ -536,6 +787,30 @@ def parse_receive_signature(signature: str) -> ABIReceive:
     return {"type": "receive", "stateMutability": "payable"}
 
 
+# Signature parsers keyed by the leading keyword
+SIGNATURE_PARSERS: dict[
+    str, Callable[[str, dict[str, list[ExtendedComponent]]], ABIElement]
+] = {
+    "function": parse_function_signature,
+    "event": parse_event_signature,
+    "error": parse_error_signature,
+    "constructor": parse_constructor_signature,
+    "fallback": lambda signature, _: parse_fallback_signature(signature),
+    "receive": lambda signature, _: parse_receive_signature(signature),
+}
+
+
+# Fixed-form signatures with a single possible result, parsed once at import
+CANONICAL_SIGNATURES: dict[str, ABIElement] = {
+    signature: parser(signature)
+    for signature, parser in (
+        ("fallback() external", parse_fallback_signature),
+        ("fallback() external payable", parse_fallback_signature),
+        ("receive() external payable", parse_receive_signature),
+    )
+}
+
+
 def parse_signature(
     signature: str, structs: dict[str, list[ExtendedComponent]] | None = None
 ) -> ABIElement:
@@ -543,28 +818,21 @@ def parse_signature(
     Parse any ABI signature and return the appropriate ABI item.
     Dispatches to the correct parser based on signature type.
     """
+    canonical = CANONICAL_SIGNATURES.get(signature)
+    if canonical is not None:
+        return canonical.copy()
+
     if structs is None:
         structs = {}
 
-    match = SIGNATURE_PREFIX.match(signature)
-    if not match:
+    # the keyword ends at the first whitespace, or at the parenthesis for
+    # constructor, fallback and receive
+    keyword = signature.partition("(")[0].split(maxsplit=1)
+    parser = SIGNATURE_PARSERS.get(keyword[0]) if keyword else None
+    if parser is None:
         raise ValueError(f"Unknown signature type: {signature}")
 
-    prefix = match.group()
-    if prefix == "function":
-        return parse_function_signature(signature, structs)
-    elif prefix == "event":
-        return parse_event_signature(signature, structs)
-    elif prefix == "error":
-        return parse_error_signature(signature, structs)
-    elif prefix == "constructor":
-        return parse_constructor_signature(signature, structs)
-    elif prefix == "fallback":
-        return parse_fallback_signature(signature)
-    elif prefix == "receive":
-        return parse_receive_signature(signature)
-    else:
-        raise ValueError(f"Unknown signature type: {prefix}")
+    return parser(signature, structs)
 
 
 def process_multiline(s: str) -> str:
@@ -581,7 +849,9 @@ def parse_abi(signatures: list[str]) -> ABI:
                    events, errors, constructors, fallback, receive, and structs
 
     Returns:
-        List of parsed ABI items (structs are excluded from output)
+        List of parsed ABI items (structs are excluded from output). The result
+        is cached per signature list, the items and their parameters are shared
+        between calls, use `copy.deepcopy` before mutating them.
 
     Example:
         >>> abi = parse_abi([
@@ -594,20 +864,27 @@ def parse_abi(signatures: list[str]) -> ABI:
     if not signatures:
         raise ValueError("At least one signature required")
 
-    signatures = [process_multiline(s) for s in signatures]
+    return list(_parse_abi(tuple(signatures)))
 
-    # First pass: extract and parse all struct definitions
-    structs = parse_structs(signatures)
 
-    # Second pass: parse all non-struct signatures with struct context
-    abi = []
-    for signature in signatures:
-        # Skip struct definitions - they're only used for type resolution
+@lru_cache(maxsize=ABI_CACHE_SIZE)
+def _parse_abi(signatures: tuple[str, ...]) -> tuple[ABIElement, ...]:
+    # Partition in one scan, struct definitions are only used for type resolution
+    struct_signatures: list[str] = []
+    other_signatures: list[str] = []
+    for signature in map(process_multiline, signatures):
         if is_struct_signature(signature):
-            continue
-
-        # Parse the signature with struct context
-        abi_item = parse_signature(signature, structs)
-        abi.append(abi_item)
+            struct_signatures.append(signature)
+        else:
+            other_signatures.append(signature)
 
-    return abi
+    # First pass: extract and parse all struct definitions
+    structs = parse_structs(struct_signatures)
+
+    # Second pass: parse all non-struct signatures with struct context, duplicated
+    # signatures are parsed once and share the item
+    parsed: dict[str, ABIElement] = {}
+    for signature in other_signatures:
+        if signature not in parsed:
+            parsed[signature] = parse_signature(signature, structs)
+    return tuple(parsed[signature] for signature in other_signatures)
@@ -308,11 +308,12 @@ def parse_supply_slot(token: bytes, traces: Iterable[dict]) -> MappingSlot | Non
             if contract != token:
                 continue
 
-            slot_bytes = HexBytes(stack[-1])
-            slot_int = int(slot_bytes.hex(), 16)
+            # read the slot number straight from the hex stack item, only
+            # the few candidates are converted to bytes
+            slot_int = int(stack[-1], 16)
             # totalSupply is usually in slots 0-100 for simple contracts
             if slot_int < 1000:
-                simple_slots.append((slot_int, slot_bytes))
+                simple_slots.append((slot_int, HexBytes(stack[-1])))
         elif op in ("CALL", "STATICCALL"):
             contracts[step["depth"] + 1] = HexBytes(stack[-2])[-20:]
         elif op == "DELEGATECALL":
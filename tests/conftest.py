@@ -2,6 +2,7 @@ import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import pyrevm
 import pytest
 import pytest_asyncio
 from eth_account import Account
@@ -129,6 +130,15 @@ async def fork_w3() -> AsyncGenerator[AsyncWeb3, None]:
         yield w3
 
 
+@pytest.fixture(scope="session")
+def vm() -> pyrevm.EVM:
+    """
+    Tracing EVM forked from mainnet, shared by the session so the fork state fetched
+    by one test is reused by the others, the traced calls must be read-only.
+    """
+    return pyrevm.EVM(fork_url=ETH_MAINNET_FORK, tracing=True, with_memory=True)
+
+
 @pytest.fixture(scope="session")
 def test_accounts() -> list[BaseAccount]:
     """Test accounts from anvil's deterministic mnemonic"""
@@ -262,6 +262,16 @@ class TestContractFromABI:
         assert "Transfer(address,address,uint256)" in transfer_event.signature
         assert "Approval(address,address,uint256)" in approval_event.signature
 
+        # lookups are indexed and reuse the same event object
+        assert contract.events.Transfer is transfer_event
+        assert contract.events.sig("Approval(address,address,uint256)") is (
+            approval_event
+        )
+        with pytest.raises(ValueError, match="No such event"):
+            contract.events.Missing
+        with pytest.raises(ValueError, match="No such event signature"):
+            contract.events.sig("Missing()")
+
 
 class TestParseLogs:
     """Test ContractEvent.parse_logs."""
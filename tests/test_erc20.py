@@ -265,8 +265,7 @@ async def test_7702(w3, test_accounts):
     assert after == before - fee
 
 
-def test_pyrevm_trace():
-    vm = pyrevm.EVM(fork_url=ETH_MAINNET_FORK, tracing=True, with_memory=True)
+def test_pyrevm_trace(vm):
     addr = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"  # USDC
     whale = "0x37305B1cD40574E4C5Ce33f8e8306Be057fD7341"
 
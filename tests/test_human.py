@@ -8,12 +8,14 @@ from eth_contract.human import (
     FALLBACK_SIGNATURE_REGEX,
     FUNCTION_MODIFIERS,
     FUNCTION_SIGNATURE_REGEX,
+    MAX_TUPLE_DEPTH,
     RECEIVE_SIGNATURE_REGEX,
     STRUCT_SIGNATURE_REGEX,
     is_solidity_type,
     is_struct_signature,
     parse_abi,
     parse_abi_parameter,
+    parse_abi_parameters,
     parse_constructor_signature,
     parse_error_signature,
     parse_event_signature,
@@ -22,6 +24,7 @@ from eth_contract.human import (
     parse_receive_signature,
     parse_signature,
     parse_structs,
+    split_abi_parameter,
     split_parameters,
 )
 
@@ -56,6 +59,13 @@ class TestSplitParameters:
                 "((uint256,(address,bool)),string)",
                 ["((uint256,(address,bool)),string)"],
             ),
+            # array suffixes and names after nested tuples
+            (
+                "(uint256,address)[2] pairs, uint256[3][] m,((bool)[])",
+                ["(uint256,address)[2] pairs", "uint256[3][] m", "((bool)[])"],
+            ),
+            # empty entries are skipped
+            ("address,,uint256,", ["address", "uint256"]),
         ],
     )
     def test_valid_parameter_splitting(self, input_str, expected):
@@ -81,6 +91,35 @@ class TestSplitParameters:
             split_parameters(input_str)
 
 
+class TestSplitABIParameter:
+    """Test splitting a parameter into type, array, modifier and name."""
+
+    @pytest.mark.parametrize(
+        "input_str, expected",
+        [
+            ("uint256", ("uint256", False, "", None, None)),
+            ("uint256[][3] amounts", ("uint256", False, "[][3]", None, "amounts")),
+            ("address payable[] to", ("address payable", False, "[]", None, "to")),
+            ("address indexed", ("address", False, "", "indexed", None)),
+            ("bytes memory data", ("bytes", False, "", "memory", "data")),
+            (
+                "(uint256,(address,bool))[] calldata pairs",
+                ("uint256,(address,bool)", True, "[]", "calldata", "pairs"),
+            ),
+        ],
+    )
+    def test_valid_split(self, input_str, expected):
+        assert split_abi_parameter(input_str) == expected
+
+    @pytest.mark.parametrize(
+        "input_str",
+        ["", " uint256", "uint256 ", "uint256 []", "(uint256) []", "uint256[x]", "()"],
+    )
+    def test_invalid_split(self, input_str):
+        with pytest.raises(ValueError, match="Invalid parameter"):
+            split_abi_parameter(input_str)
+
+
 class TestParseABIParameter:
     """Test ABI parameter parsing."""
 
@@ -346,7 +385,14 @@ class TestParseFunctionSignature:
             # Invalid function signature
             ("invalid signature", "Invalid function signature"),
             # Function with invalid state mutability
-            ("function test() invalid returns (uint256)", "Invalid parenthesis"),
+            (
+                "function test() invalid returns (uint256)",
+                "Invalid function signature",
+            ),
+            # Unbalanced parameter list
+            ("function test((uint256) external", "Invalid function signature"),
+            # Unbalanced returns
+            ("function test() returns ((uint256)", "Invalid parenthesis"),
         ],
     )
     def test_invalid_function_signatures(self, signature, expected_error):
@@ -866,6 +912,15 @@ class TestParseSignature:
         result = parse_signature(signature)
         assert result == expected
 
+    def test_canonical_signature_returns_copy(self):
+        """Fixed-form signatures return a fresh dict on every call."""
+        result = parse_signature("fallback() external")
+        assert result == {"type": "fallback", "stateMutability": "nonpayable"}
+        result["stateMutability"] = "payable"
+        assert parse_signature("fallback() external")["stateMutability"] == (
+            "nonpayable"
+        )
+
     def test_parse_signature_with_structs(self):
         """Test parsing signatures with struct definitions."""
         structs = {
@@ -898,6 +953,11 @@ class TestParseSignature:
         [
             # Unknown signature type
             ("unknown signature type", "Unknown signature type"),
+            ("functions foo()", "Unknown signature type"),
+            ("(uint256)", "Unknown signature type"),
+            ("", "Unknown signature type"),
+            # Known keyword, malformed signature
+            ("function foo(", "Invalid function signature"),
         ],
     )
     def test_invalid_signature_parsing(self, signature, expected_error):
@@ -1231,6 +1291,29 @@ class TestParseStructs:
             },
         ]
 
+    def test_nested_structs_resolved_once(self):
+        """Every struct is resolved once and shared by all references to it."""
+        signatures = ["struct S0 { uint256 a; uint256 b; }"] + [
+            f"struct S{i} {{ S{i - 1} a; S{i - 1}[2] b; }}" for i in range(1, 20)
+        ]
+        structs = parse_structs(signatures)
+        assert list(structs) == [f"S{i}" for i in range(20)]
+        for i in range(1, 20):
+            a, b = structs[f"S{i}"]
+            assert a["components"] is b["components"] is structs[f"S{i - 1}"]
+            assert b["type"] == "tuple[2]"
+            assert b["internalType"] == f"struct S{i - 1}[2]"
+
+    def test_parse_structs_cached(self):
+        """Same signatures return the same resolved struct lookup."""
+        signatures = [
+            "struct Point { uint256 x; uint256 y; }",
+            "struct Line { Point start; Point end; }",
+        ]
+        structs = parse_structs(signatures)
+        assert parse_structs(iter(signatures)) is structs
+        assert parse_structs(signatures[:1]) is not structs
+
     @pytest.mark.parametrize(
         "signatures, expected_error",
         [
@@ -1239,6 +1322,12 @@ class TestParseStructs:
                 ["struct A { B b; }", "struct B { A a; }"],
                 "Circular reference detected",
             ),
+            # Indirect and self references
+            (
+                ["struct A { B b; }", "struct B { C c; }", "struct C { A[] a; }"],
+                "Circular reference detected",
+            ),
+            (["struct A { uint256 x; A next; }"], "Circular reference detected"),
             # Invalid struct signature - empty
             (
                 ["struct Invalid { }"],
@@ -1424,6 +1513,57 @@ class TestParseABI:
             }
         ]
 
+    def test_abi_shares_struct_components(self):
+        """Struct components are shared by every reference, not copied."""
+        abi = parse_abi(
+            [
+                "struct Point { uint256 x; uint256 y; }",
+                "struct Line { Point start; Point end; }",
+                "function drawLine(Line line, Point[] points)",
+            ]
+        )
+        line, points = abi[0]["inputs"]
+        start, end = line["components"]
+        assert start["components"] is end["components"] is points["components"]
+
+    def test_parse_abi_duplicate_signatures(self):
+        """Duplicated signatures keep their positions and share the parsed item."""
+        abi = parse_abi(
+            [
+                "function transfer(address to, uint256 amount)",
+                "event Transfer(address indexed from, address indexed to)",
+                "function  transfer(address to,\n uint256 amount)",
+            ]
+        )
+        assert [item["type"] for item in abi] == ["function", "event", "function"]
+        assert abi[0] is abi[2]
+
+    def test_struct_type_strings_interned(self):
+        """Type strings of resolved struct references are shared objects."""
+        structs = parse_structs(
+            [
+                "struct Point { uint256 x; uint256 y; }",
+                "struct Line { Point start; Point[2] end; }",
+                "struct Path { Point[2] points; }",
+            ]
+        )
+        line_end, path_points = structs["Line"][1], structs["Path"][0]
+        assert line_end["type"] is path_points["type"]
+        assert line_end["internalType"] is path_points["internalType"]
+
+    def test_parse_abi_cached(self):
+        """Same signatures reuse the parsed items, each call gets its own list."""
+        signatures = [
+            "struct Point { uint256 x; uint256 y; }",
+            "function draw(Point p)",
+            "event Drawn(Point p)",
+        ]
+        abi = parse_abi(signatures)
+        again = parse_abi(list(signatures))
+        assert again == abi and again is not abi
+        assert all(a is b for a, b in zip(abi, again))
+        assert parse_abi(signatures[1:2])[0] is not abi[0]
+
     @pytest.mark.parametrize(
         "signature, expected_name, expected_properties",
         [
@@ -1547,6 +1687,7 @@ class TestEdgeCases:
 
         # Should be the same object (cached)
         assert param1 is param2
+        assert len(parameter_cache) == 1
 
     def test_parameter_cache_with_different_structs(self):
         """Test parameter cache behavior with different struct contexts."""
@@ -1564,6 +1705,81 @@ class TestEdgeCases:
         # Should be different objects due to different struct contexts
         assert param1 is not param2
 
+    def test_parameter_cache_validates_modifiers(self):
+        """Cache hits still validate the modifier against the allowed set."""
+        parse_abi_parameter("uint256 indexed value", EVENT_MODIFIERS)
+        with pytest.raises(ValueError, match="Invalid modifier 'indexed'"):
+            parse_abi_parameter("uint256 indexed value", FUNCTION_MODIFIERS)
+
+    def test_tuple_members_shared(self):
+        """Non-tuple members of tuples are the cached parameter objects."""
+        address = parse_abi_parameter("address")
+        result = parse_abi_parameter("(address, (uint256, address)[])")
+        inner = result["components"][1]["components"]
+        assert result["components"][0] is address
+        assert inner[1] is address
+
+    def test_deeply_nested_tuple(self):
+        """Tuples are parsed up to `MAX_TUPLE_DEPTH` levels of nesting."""
+        depth = MAX_TUPLE_DEPTH
+        result = parse_abi_parameter("(" * depth + "uint256" + ")" * depth + " x")
+        assert result["name"] == "x"
+        for _ in range(depth):
+            assert result["type"] == "tuple"
+            (result,) = result["components"]
+        assert result == {"type": "uint256"}
+
+        depth += 1
+        with pytest.raises(ValueError, match="nested deeper than"):
+            parse_abi_parameter("(" * depth + "uint256" + ")" * depth)
+
+    def test_parse_abi_parameters(self):
+        """A parameter list is split and parsed against one struct context."""
+        structs = parse_structs(["struct Foo { uint256 a; }"])
+        assert parse_abi_parameters("Foo foo, (bool, Foo)[] bar", structs=structs) == [
+            parse_abi_parameter("Foo foo", structs=structs),
+            parse_abi_parameter("(bool, Foo)[] bar", structs=structs),
+        ]
+        assert parse_abi_parameters("") == []
+        with pytest.raises(ValueError, match="Invalid modifier 'indexed'"):
+            parse_abi_parameters("uint256 a, bool indexed b", FUNCTION_MODIFIERS)
+
+
+@pytest.mark.parametrize(
+    "regex,signature",
+    [
+        (ERROR_SIGNATURE_REGEX, "error Foo()\n"),
+        (EVENT_SIGNATURE_REGEX, "event Foo()\n"),
+        (FUNCTION_SIGNATURE_REGEX, "function foo()\n"),
+        (CONSTRUCTOR_SIGNATURE_REGEX, "constructor()\n"),
+        (FALLBACK_SIGNATURE_REGEX, "fallback() external\n"),
+        (RECEIVE_SIGNATURE_REGEX, "receive() external payable\n"),
+        (STRUCT_SIGNATURE_REGEX, "struct Foo { uint256 a; }\n"),
+    ],
+)
+def test_signature_regex_rejects_trailing_newline(regex, signature):
+    """Signature regexes anchor at the very end, not before a trailing newline."""
+    assert regex.match(signature) is None
+    assert regex.match(signature.rstrip()) is not None
+
+
+def test_struct_body_stops_at_braces():
+    """A struct body can't run across the braces of another definition."""
+    assert not is_struct_signature("struct A { uint256 a; }\nstruct B { uint256 b; }")
+    assert parse_structs(["struct A { uint256 a; }\nstruct B { uint256 b; }"]) == {}
+
+
+def test_multiline_signature_without_preprocessing():
+    """Signature regexes match across newlines without `process_multiline`."""
+    assert parse_structs(["struct Point {\n  uint256 x;\n  uint256 y;\n}"]) == {
+        "Point": [{"type": "uint256", "name": "x"}, {"type": "uint256", "name": "y"}]
+    }
+    func = parse_function_signature("function f(\n  uint256 a,\n  bool b\n)")
+    assert func["inputs"] == [
+        {"type": "uint256", "name": "a"},
+        {"type": "bool", "name": "b"},
+    ]
+
 
 def test_multiline_signature():
     parse_abi(
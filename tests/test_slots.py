@@ -2,9 +2,9 @@
 Test for slots module using pyrevm with memory tracing.
 """
 
+import asyncio
 import os
 
-import pyrevm
 import pytest
 from eth_utils import to_hex
 from hexbytes import HexBytes
@@ -22,7 +22,7 @@ from .trace import trace_call
 
 
 @pytest.mark.asyncio
-async def test_pyrevm_balance_slot_tracing():
+async def test_pyrevm_balance_slot_tracing(vm):
     """Test balance slot detection with pyrevm tracing"""
     # USDC contract
     token = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
@@ -30,7 +30,6 @@ async def test_pyrevm_balance_slot_tracing():
     fn = ERC20.fns.balanceOf(user)
 
     # Capture and parse traces
-    vm = pyrevm.EVM(fork_url=ETH_MAINNET_FORK, tracing=True, with_memory=True)
     traces = trace_call(vm, to=token, data=fn.data)
 
     # Parse balance slot from traces
@@ -47,7 +46,7 @@ async def test_pyrevm_balance_slot_tracing():
 
 
 @pytest.mark.asyncio
-async def test_pyrevm_supply_slot_tracing():
+async def test_pyrevm_supply_slot_tracing(vm):
     """Test supply slot detection with pyrevm tracing"""
     tokens = [
         ("WETH", "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"),
@@ -56,12 +55,13 @@ async def test_pyrevm_supply_slot_tracing():
         ("MKR", "0x9f8F72aA9304c8B593d555F12eF6589cC3A579A2"),
     ]
     fn = ERC20.fns.totalSupply()
-    # Capture and parse traces
-    vm = pyrevm.EVM(fork_url=ETH_MAINNET_FORK, tracing=True, with_memory=True)
     w3 = AsyncWeb3(AsyncHTTPProvider(ETH_MAINNET_FORK))
     block = await w3.eth.block_number
-    for name, token in tokens:
+
+    async def check(name: str, token: str) -> None:
         print("Testing", name, token)
+        # tracing is synchronous and finishes before the first await, so the
+        # shared vm is only used by one token at a time
         traces = trace_call(vm, to=token, data=fn.data)
 
         # Parse totalSupply slot from traces
@@ -85,9 +85,12 @@ async def test_pyrevm_supply_slot_tracing():
                 w3, to=token, state_override={token: {"stateDiff": state}}
             )
 
+    # the RPC checks of the tokens are independent, overlap their latency
+    await asyncio.gather(*(check(name, token) for name, token in tokens))
+
 
 @pytest.mark.asyncio
-async def test_pyrevm_allowance_slot_tracing():
+async def test_pyrevm_allowance_slot_tracing(vm):
     """Test allowance slot detection with pyrevm tracing and memory support."""
     # USDC contract
     token = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
@@ -96,11 +99,7 @@ async def test_pyrevm_allowance_slot_tracing():
     fn = ERC20.fns.allowance(owner, spender)
 
     # Capture and parse traces
-    traces = trace_call(
-        pyrevm.EVM(fork_url=ETH_MAINNET_FORK, tracing=True, with_memory=True),
-        to=token,
-        data=fn.data,
-    )
+    traces = trace_call(vm, to=token, data=fn.data)
 
     # Parse allowance slot from traces
     slot = parse_allowance_slot(HexBytes(token), owner, HexBytes(spender), traces)
@@ -115,3 +114,20 @@ async def test_pyrevm_allowance_slot_tracing():
     assert int.from_bytes(bz, "big") == await fn.call(
         w3, to=token, state_override={token: {"stateDiff": state}}
     )
+
+
+def test_parse_supply_slot():
+    """The smallest slot read by the token itself is taken as the supply slot."""
+    token = HexBytes(b"\x11" * 20)
+    other = "0x" + "22" * 20
+    traces = [
+        {"op": "SLOAD", "depth": 1, "stack": ["0x" + "ab" * 32]},
+        {"op": "SLOAD", "depth": 1, "stack": ["0x5"]},
+        {"op": "STATICCALL", "depth": 1, "stack": [other, "0x0"]},
+        {"op": "SLOAD", "depth": 2, "stack": ["0x0"]},
+        {"op": "SLOAD", "depth": 1, "stack": ["0x2"]},
+    ]
+    slot = parse_supply_slot(token, traces)
+    assert slot is not None
+    assert slot.slot == (2).to_bytes(32, "big")
+    assert parse_supply_slot(token, traces[:1]) is None
@@ -21,6 +21,7 @@ def trace_call(vm: pyrevm.EVM, **tx: Unpack[TxParams]) -> Iterable[dict]:
             value=tx.get("value", 0),
         )
 
-    out.seek(0)
-    for line in out.readlines():
-        yield json.loads(line)
+    # split the captured buffer once instead of reading it line by line
+    for line in out.getvalue().splitlines():
+        if line:
+            yield json.loads(line)